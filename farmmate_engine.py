@@ -70,31 +70,61 @@ class GeneralAssumptions:
         else:
             return date.year + 1
     
+    def __post_init__(self):
+        self._specialize_gst_schedule()
+
+    def __setattr__(self, name, value):
+        object.__setattr__(self, name, value)
+        # Re-specialize when an input to the cached GST schedule changes
+        if name in ('gst_reporting_period', 'gst_payment_delay', 'num_months') \
+                and 'get_gst_payment_months' in self.__dict__:
+            self._specialize_gst_schedule()
+
+    def _specialize_gst_schedule(self):
+        """Bind get_gst_payment_months to the configured reporting period
+
+        The reporting period is fixed between mutations, so the schedule is
+        computed once here and the accessor is rebound per-instance to a
+        method that just returns the cached list - no string compare or
+        if/elif dispatch on the hot path.
+        """
+        impl = {
+            'monthly': self._impl_monthly,
+            'quarterly': self._impl_quarterly,
+            'annual': self._impl_annual,
+        }.get(self.gst_reporting_period, lambda: [])
+        object.__setattr__(self, '_gst_payment_months', impl())
+        object.__setattr__(self, 'get_gst_payment_months', self._cached_gst_payment_months)
+
+    def _impl_monthly(self) -> List[int]:
+        # Pay every month with delay
+        return [month + self.gst_payment_delay
+                for month in range(1, self.num_months + 1)
+                if month + self.gst_payment_delay <= self.num_months]
+
+    def _impl_quarterly(self) -> List[int]:
+        # Pay in months 4, 7, 10, 13 (with delay)
+        return [quarter_end + self.gst_payment_delay
+                for quarter_end in [3, 6, 9, 12]
+                if quarter_end + self.gst_payment_delay <= self.num_months]
+
+    def _impl_annual(self) -> List[int]:
+        # Pay once at year end
+        if 12 + self.gst_payment_delay <= self.num_months:
+            return [12 + self.gst_payment_delay]
+        return []
+
+    def _cached_gst_payment_months(self) -> List[int]:
+        return self._gst_payment_months
+
     def get_gst_payment_months(self) -> List[int]:
-        """Get months when GST is paid based on reporting period"""
-        payment_months = []
-        
-        if self.gst_reporting_period == "monthly":
-            # Pay every month with delay
-            for month in range(1, self.num_months + 1):
-                payment_month = month + self.gst_payment_delay
-                if payment_month <= self.num_months:
-                    payment_months.append(payment_month)
-        
-        elif self.gst_reporting_period == "quarterly":
-            # Pay in months 4, 7, 10, 13 (with delay)
-            for quarter_end in [3, 6, 9, 12]:
-                payment_month = quarter_end + self.gst_payment_delay
-                if payment_month <= self.num_months:
-                    payment_months.append(payment_month)
-        
-        elif self.gst_reporting_period == "annual":
-            # Pay once at year end
-            payment_month = 12 + self.gst_payment_delay
-            if payment_month <= self.num_months:
-                payment_months.append(payment_month)
-        
-        return payment_months
+        """Get months when GST is paid based on reporting period
+
+        Shadowed per-instance in __post_init__ by the cached accessor; this
+        class-level fallback re-specializes and delegates.
+        """
+        self._specialize_gst_schedule()
+        return self._gst_payment_months
 
 
 @dataclass
@@ -136,6 +166,20 @@ class InflationRates:
         rate = getattr(self, category, self.all_expenses)
         return base_value * ((1 + rate) ** years)
 
+    def build_inflator_matrix(self, categories: List[str], num_years: int) -> np.ndarray:
+        """Build a (category x year) matrix of inflation factors
+
+        Returns (len(categories), num_years) of (1 + rate) ** year, so a
+        whole grid of base values can be inflated with one elementwise
+        multiply instead of per-cell apply_inflation calls. Year 0 is the
+        base year (factor 1.0); unknown categories fall back to
+        all_expenses, matching apply_inflation.
+        """
+        rates = np.array([getattr(self, category, self.all_expenses)
+                          for category in categories], dtype=np.float64)
+        years = np.arange(num_years, dtype=np.float64)
+        return (1.0 + rates[:, None]) ** years[None, :]
+
 
 @dataclass
 class PaymentTiming:
@@ -241,7 +285,9 @@ class PlannedCapex:
         """Convert planned CAPEX to fixed asset after purchase"""
         # Calculate purchase date
         purchase_date = start_date + relativedelta(months=self.purchase_month - 1)
-        
+        return self._to_fixed_asset(purchase_date)
+
+    def _to_fixed_asset(self, purchase_date: datetime) -> FixedAsset:
         return FixedAsset(
             asset_name=self.asset_name,
             asset_class=self.asset_class,
@@ -252,6 +298,17 @@ class PlannedCapex:
             residual_value=self.residual_value
         )
 
+    @classmethod
+    def bulk_to_fixed_assets(cls, capex_list: List['PlannedCapex'],
+                             month_dates: pd.DatetimeIndex) -> List[FixedAsset]:
+        """Convert a batch of planned CAPEX to fixed assets
+
+        Indexes a precomputed month-start date table instead of running
+        relativedelta arithmetic per item.
+        """
+        return [capex._to_fixed_asset(month_dates[capex.purchase_month - 1])
+                for capex in capex_list]
+
 
 @dataclass
 class PlannedDisposal:
@@ -294,10 +351,32 @@ class PastureProgram:
         """Get costs for a specific month (simplified - spread evenly)"""
         if month < self.start_month or month > self.start_month + 6:
             return 0.0
-        
+
         total_cost = self.calculate_total_cost()
         # Spread over 6 months from start
         return total_cost / 6
+
+    def get_monthly_cost_array(self, num_months: int) -> np.ndarray:
+        """Costs for months 1..num_months as a dense array"""
+        costs = np.zeros(num_months)
+        first = max(self.start_month, 1)
+        last = min(self.start_month + 6, num_months)
+        if first <= last:
+            costs[first - 1:last] = self.calculate_total_cost() / 6
+        return costs
+
+    def monthly_cost_array(self, num_months: int) -> np.ndarray:
+        """Memoized dense cost series; any field mutation invalidates it"""
+        cache = getattr(self, '_cost_cache', None)
+        if cache is None or len(cache) != num_months:
+            cache = self.get_monthly_cost_array(num_months)
+            object.__setattr__(self, '_cost_cache', cache)
+        return cache
+
+    def __setattr__(self, name, value):
+        object.__setattr__(self, name, value)
+        if name != '_cost_cache' and getattr(self, '_cost_cache', None) is not None:
+            object.__setattr__(self, '_cost_cache', None)
     
 
 @dataclass
@@ -337,7 +416,7 @@ class CropMargin:
         return revenue - total_costs
 
 
-@dataclass
+@dataclass(slots=True)
 class LivestockClass:
     """Livestock class definition (beef or sheep)"""
     class_name: str
@@ -360,19 +439,35 @@ class LivestockClass:
     wool_yield_pct: float = 0.0  # Clean wool percentage (e.g., 0.65 for 65%)
     shearing_frequency: int = 1  # Times per year (1 or 2)
     shearing_months: List[int] = field(default_factory=list)  # Months when shorn
-    
-    @property
-    def value_per_head(self) -> float:
-        """Calculate value per head from weight and price"""
-        return self.avg_weight_kg * self.price_per_kg
-    
+
+    # Derived values, cached so hot stock-value loops read plain attributes
+    value_per_head: float = field(init=False, default=0.0)
+    _annual_wool_kg: float = field(init=False, default=0.0, repr=False)
+
+    # Inputs whose mutation invalidates the cached derived values
+    _DERIVED_INPUTS = ('avg_weight_kg', 'price_per_kg', 'produces_wool',
+                       'fleece_weight_kg', 'wool_yield_pct', 'shearing_frequency')
+
+    def __post_init__(self):
+        self._recompute_derived()
+
+    def __setattr__(self, name, value):
+        object.__setattr__(self, name, value)
+        if name in self._DERIVED_INPUTS and hasattr(self, 'value_per_head'):
+            self._recompute_derived()
+
+    def _recompute_derived(self):
+        """Recompute value per head and annual clean wool per head"""
+        object.__setattr__(self, 'value_per_head', self.avg_weight_kg * self.price_per_kg)
+        if self.produces_wool:
+            greasy_wool = self.fleece_weight_kg * self.shearing_frequency
+            object.__setattr__(self, '_annual_wool_kg', greasy_wool * self.wool_yield_pct)
+        else:
+            object.__setattr__(self, '_annual_wool_kg', 0.0)
+
     def annual_wool_production_kg(self) -> float:
-        """Calculate annual clean wool production per head"""
-        if not self.produces_wool:
-            return 0.0
-        greasy_wool = self.fleece_weight_kg * self.shearing_frequency
-        clean_wool = greasy_wool * self.wool_yield_pct
-        return clean_wool
+        """Annual clean wool production per head (cached)"""
+        return self._annual_wool_kg
 
 
 @dataclass
@@ -471,7 +566,58 @@ class LivestockProgram:
     death_rate_annual: float = 0.02  # 2% annual
     birth_rate_annual: float = 0.0  # Only for breeding females
     birth_month: int = 0  # Month when births occur
-    
+
+    @staticmethod
+    def from_dict_records(records: Dict[int, object]) -> Tuple[np.ndarray, ...]:
+        """Convert a {month: value(s)} dict into sorted parallel arrays (SoA)
+
+        Returns (months, col0, col1, ...) where months is int32 and each value
+        column is float64. Scalar-valued dicts produce a single value column.
+        """
+        months = np.array(sorted(records), dtype=np.int32)
+        if len(months) == 0:
+            return (months, np.array([], dtype=np.float64))
+        width = len(np.atleast_1d(records[int(months[0])]))
+        columns = tuple(
+            np.array([np.atleast_1d(records[int(m)])[i] for m in months], dtype=np.float64)
+            for i in range(width)
+        )
+        return (months,) + columns
+
+    @staticmethod
+    def to_dict_records(months: np.ndarray, *columns: np.ndarray) -> Dict[int, object]:
+        """Convert parallel arrays back to the legacy {month: value(s)} dict form"""
+        if len(columns) == 1:
+            return {int(m): v for m, v in zip(months, columns[0])}
+        return {int(m): tuple(col[i] for col in columns) for i, m in enumerate(months)}
+
+    def _build_movement_arrays(self):
+        """Rebuild the internal SoA arrays from the (mutable) dict fields
+
+        The dicts remain the public API; callers mutate them freely between
+        calculations, so the arrays are rebuilt at the start of each
+        calculation pass rather than tracked per-mutation.
+        """
+        def arrays(records: Dict, width: int) -> Tuple[np.ndarray, ...]:
+            if not records:
+                empty_cols = tuple(np.array([], dtype=np.float64) for _ in range(width))
+                return (np.array([], dtype=np.int32),) + empty_cols
+            return self.from_dict_records(records)
+
+        self._purchase_months, self._purchase_head, self._purchase_price = \
+            arrays(self.purchases_by_month, 2)
+        (self._sale_months, self._sale_head,
+         self._sale_price, self._sale_weight) = arrays(self.sales_by_month, 3)
+        self._death_months, self._death_head = arrays(self.deaths_by_month, 1)
+        self._birth_months, self._birth_head = arrays(self.births_by_month, 1)
+        self._tin_months, self._tin_head = arrays(self.transfers_in_by_month, 1)
+        self._tout_months, self._tout_head = arrays(self.transfers_out_by_month, 1)
+
+    def _ensure_movement_arrays(self):
+        """Build the SoA arrays if they have not been built yet"""
+        if not hasattr(self, '_purchase_months'):
+            self._build_movement_arrays()
+
     def get_monthly_deaths(self, month: int, opening_head: int) -> int:
         """Calculate deaths for the month based on annual death rate"""
         if month in self.deaths_by_month:
@@ -487,20 +633,16 @@ class LivestockProgram:
         
         if month != livestock_class.weaning_month:
             return 0
-        
+
+        self._ensure_movement_arrays()
+
         # Calculate breeding females (opening + purchases - sales - deaths)
         breeding_females = self.opening_head
-        
-        # Add purchases up to this month
-        for m, (head, price) in self.purchases_by_month.items():
-            if m < month:
-                breeding_females += head
-        
-        # Subtract sales up to this month
-        for m, (head, price, weight) in self.sales_by_month.items():
-            if m < month:
-                breeding_females -= head
-        
+
+        # Add purchases and subtract sales up to this month (arrays are sorted)
+        breeding_females += int(self._purchase_head[:np.searchsorted(self._purchase_months, month)].sum())
+        breeding_females -= int(self._sale_head[:np.searchsorted(self._sale_months, month)].sum())
+
         # Subtract deaths up to this month
         for m in range(1, month):
             breeding_females -= self.get_monthly_deaths(m, breeding_females)
@@ -517,64 +659,92 @@ class LivestockProgram:
     
     def calculate_stock_reconciliation(self, num_months: int) -> pd.DataFrame:
         """Calculate month-by-month stock reconciliation"""
-        recon_data = []
-        
+        self._build_movement_arrays()
+
+        # Scatter sparse movement events into dense per-month arrays (index = month)
+        def scatter(months: np.ndarray, values: np.ndarray) -> np.ndarray:
+            dense = np.zeros(num_months + 1, dtype=np.int64)
+            mask = (months >= 1) & (months <= num_months)
+            dense[months[mask]] = values[mask].astype(np.int64)
+            return dense
+
+        purchases = scatter(self._purchase_months, self._purchase_head)
+        sales = scatter(self._sale_months, self._sale_head)
+        births = scatter(self._birth_months, self._birth_head)
+        transfers_in = scatter(self._tin_months, self._tin_head)
+        transfers_out = scatter(self._tout_months, self._tout_head)
+
+        # Explicit death overrides vs rate-based deaths (which depend on opening head)
+        death_overrides = scatter(self._death_months, self._death_head)
+        has_override = np.zeros(num_months + 1, dtype=bool)
+        in_range = (self._death_months >= 1) & (self._death_months <= num_months)
+        has_override[self._death_months[in_range]] = True
+
+        monthly_death_rate = self.death_rate_annual / 12
+        opening = np.zeros(num_months + 1, dtype=np.int64)
+        deaths = np.zeros(num_months + 1, dtype=np.int64)
+        closing = np.zeros(num_months + 1, dtype=np.int64)
+
         current_head = self.opening_head
-        
         for month in range(1, num_months + 1):
-            # Opening
-            opening = current_head
-            
-            # Movements
-            purchases = self.purchases_by_month.get(month, (0, 0))[0]
-            sales = self.sales_by_month.get(month, (0, 0, 0))[0]
-            deaths = self.get_monthly_deaths(month, opening)
-            births = self.births_by_month.get(month, 0)
-            transfers_in = self.transfers_in_by_month.get(month, 0)
-            transfers_out = self.transfers_out_by_month.get(month, 0)
-            
-            # Closing
-            closing = opening + purchases + births + transfers_in - sales - deaths - transfers_out
-            
-            recon_data.append({
-                'month': month,
-                'opening': opening,
-                'purchases': purchases,
-                'births': births,
-                'transfers_in': transfers_in,
-                'deaths': deaths,
-                'sales': sales,
-                'transfers_out': transfers_out,
-                'closing': closing
-            })
-            
-            current_head = closing
-        
-        return pd.DataFrame(recon_data)
+            opening[month] = current_head
+            if has_override[month]:
+                deaths[month] = death_overrides[month]
+            else:
+                deaths[month] = int(current_head * monthly_death_rate)
+            closing[month] = (current_head + purchases[month] + births[month] +
+                              transfers_in[month] - sales[month] - deaths[month] -
+                              transfers_out[month])
+            current_head = closing[month]
+
+        return pd.DataFrame({
+            'month': np.arange(1, num_months + 1),
+            'opening': opening[1:],
+            'purchases': purchases[1:],
+            'births': births[1:],
+            'transfers_in': transfers_in[1:],
+            'deaths': deaths[1:],
+            'sales': sales[1:],
+            'transfers_out': transfers_out[1:],
+            'closing': closing[1:]
+        })
     
     def calculate_trading_profit(self, month: int, opening_value: float, closing_value: float) -> Dict:
         """Calculate trading profit for the month"""
+        self._ensure_movement_arrays()
+
+        # Binary search for the month in each sorted movement array
+        def lookup(months: np.ndarray, *columns: np.ndarray) -> Optional[Tuple[float, ...]]:
+            idx = np.searchsorted(months, month)
+            if idx < len(months) and months[idx] == month:
+                return tuple(float(col[idx]) for col in columns)
+            return None
+
         # Sales revenue
         sales_revenue = 0.0
-        if month in self.sales_by_month:
-            head, price_per_kg, avg_weight = self.sales_by_month[month]
+        sale = lookup(self._sale_months, self._sale_head, self._sale_price, self._sale_weight)
+        if sale is not None:
+            head, price_per_kg, avg_weight = sale
             sales_revenue = head * price_per_kg * avg_weight
-        
+
         # Purchase cost
         purchase_cost = 0.0
-        if month in self.purchases_by_month:
-            head, price = self.purchases_by_month[month]
+        purchase = lookup(self._purchase_months, self._purchase_head, self._purchase_price)
+        if purchase is not None:
+            head, price = purchase
             purchase_cost = head * price
-        
+
         # Natural increase/decrease value
         births_value = 0.0
-        if month in self.births_by_month:
+        birth = lookup(self._birth_months, self._birth_head)
+        if birth is not None:
             # Value births at opening value (simplified)
-            births_value = self.births_by_month[month] * self.opening_value_per_head
-        
+            births_value = birth[0] * self.opening_value_per_head
+
         deaths_value = 0.0
-        if month in self.deaths_by_month:
-            deaths_value = self.deaths_by_month[month] * self.opening_value_per_head
+        death = lookup(self._death_months, self._death_head)
+        if death is not None:
+            deaths_value = death[0] * self.opening_value_per_head
         
         # Stock value change
         stock_value_change = closing_value - opening_value
@@ -593,13 +763,19 @@ class LivestockProgram:
     
     def calculate_closing_head(self, month: int) -> int:
         """Calculate closing head count for a month"""
+        self._ensure_movement_arrays()
+
+        # Sum each sorted movement array up to and including the month
+        def total(months: np.ndarray, values: np.ndarray) -> int:
+            return int(values[:np.searchsorted(months, month, side='right')].sum())
+
         opening = self.opening_head
-        purchases = sum(h for m, (h, p) in self.purchases_by_month.items() if m <= month)
-        sales = sum(h for m, (h, p, w) in self.sales_by_month.items() if m <= month)
-        deaths = sum(self.deaths_by_month.get(m, 0) for m in range(1, month + 1))
-        births = sum(self.births_by_month.get(m, 0) for m in range(1, month + 1))
-        transfers_in = sum(self.transfers_in_by_month.get(m, 0) for m in range(1, month + 1))
-        transfers_out = sum(self.transfers_out_by_month.get(m, 0) for m in range(1, month + 1))
+        purchases = total(self._purchase_months, self._purchase_head)
+        sales = total(self._sale_months, self._sale_head)
+        deaths = total(self._death_months, self._death_head)
+        births = total(self._birth_months, self._birth_head)
+        transfers_in = total(self._tin_months, self._tin_head)
+        transfers_out = total(self._tout_months, self._tout_head)
         return opening + purchases + births + transfers_in - sales - deaths - transfers_out
 
 
@@ -620,6 +796,29 @@ class OverheadCategory:
             return self.one_off_amount or 0.0
         return 0.0
 
+    def get_monthly_cost_array(self, num_months: int) -> np.ndarray:
+        """Costs for months 1..num_months as a dense array"""
+        if self.allocation_method == 'straight_line':
+            return np.full(num_months, self.monthly_amount, dtype=np.float64)
+        costs = np.zeros(num_months)
+        if (self.allocation_method == 'one_off' and self.one_off_month is not None
+                and 1 <= self.one_off_month <= num_months):
+            costs[self.one_off_month - 1] = self.one_off_amount or 0.0
+        return costs
+
+    def monthly_cost_array(self, num_months: int) -> np.ndarray:
+        """Memoized dense cost series; any field mutation invalidates it"""
+        cache = getattr(self, '_cost_cache', None)
+        if cache is None or len(cache) != num_months:
+            cache = self.get_monthly_cost_array(num_months)
+            object.__setattr__(self, '_cost_cache', cache)
+        return cache
+
+    def __setattr__(self, name, value):
+        object.__setattr__(self, name, value)
+        if name != '_cost_cache' and getattr(self, '_cost_cache', None) is not None:
+            object.__setattr__(self, '_cost_cache', None)
+
 
 @dataclass
 class DebtFacility:
@@ -631,17 +830,63 @@ class DebtFacility:
     establishment_date: datetime
     repayment_schedule: Dict[int, float] = field(default_factory=dict)  # {month: repayment}
     drawdown_schedule: Dict[int, float] = field(default_factory=dict)  # {month: drawdown}
-    
+
+    def __post_init__(self):
+        self._prepared_months = 0
+
+    def prepare(self, num_months: int):
+        """Precompute dense balance and interest arrays for the model period
+
+        Scatters the sparse schedules into per-month arrays and takes one
+        prefix sum, so calculate_balance/calculate_interest become O(1)
+        lookups instead of re-summing the schedule on every query. Call
+        again after mutating the schedules.
+        """
+        self._draw_arr = np.zeros(num_months, dtype=np.float64)
+        self._repay_arr = np.zeros(num_months, dtype=np.float64)
+        for month, amount in self.drawdown_schedule.items():
+            if 1 <= month <= num_months:
+                self._draw_arr[month - 1] += amount
+        for month, amount in self.repayment_schedule.items():
+            if 1 <= month <= num_months:
+                self._repay_arr[month - 1] += amount
+
+        self._balance_arr = np.maximum(
+            np.cumsum(self._draw_arr - self._repay_arr) + self.principal, 0)
+        self._interest_arr = (np.concatenate(([self.principal], self._balance_arr[:-1])) *
+                              (self.interest_rate / 12))
+        self._prepared_months = num_months
+
+    def as_arrays(self, num_months: int) -> tuple:
+        """Dense (drawdowns, repayments) arrays for months 1..num_months
+
+        Converts the sparse schedules once (cached by prepare) so callers
+        index arrays instead of hashing into the dicts per month.
+        """
+        if self._prepared_months < num_months:
+            self.prepare(num_months)
+        return self._draw_arr[:num_months], self._repay_arr[:num_months]
+
+    def interest_series(self, num_months: int) -> np.ndarray:
+        """Monthly interest for months 1..num_months as a dense array"""
+        if self._prepared_months < num_months:
+            self.prepare(num_months)
+        return self._interest_arr[:num_months]
+
     def calculate_balance(self, month: int) -> float:
         """Calculate outstanding balance at month end"""
+        if 1 <= month <= self._prepared_months:
+            return float(self._balance_arr[month - 1])
         balance = self.principal
         for m in range(1, month + 1):
             balance += self.drawdown_schedule.get(m, 0)
             balance -= self.repayment_schedule.get(m, 0)
         return max(balance, 0)
-    
+
     def calculate_interest(self, month: int) -> float:
         """Calculate interest for the month"""
+        if 1 <= month <= self._prepared_months:
+            return float(self._interest_arr[month - 1])
         balance = self.calculate_balance(month - 1) if month > 1 else self.principal
         monthly_rate = self.interest_rate / 12
         return balance * monthly_rate
@@ -709,6 +954,256 @@ class GSTCalculation:
 # CALCULATION ENGINE
 # ============================================================================
 
+# P&L column groups used for GST and cash flow rollups
+REV_COLS = ['crop_revenue', 'beef_revenue', 'sheep_revenue', 'wool_revenue', 'other_income']
+EXP_COLS = ['crop_direct_costs', 'beef_direct_costs', 'sheep_direct_costs',
+            'wool_direct_costs', 'pasture_costs', 'overheads']
+
+# Livestock enterprise type -> (revenue column, direct cost column)
+ENTERPRISE_COLS = {
+    'beef': ('beef_revenue', 'beef_direct_costs'),
+    'sheep': ('sheep_revenue', 'sheep_direct_costs'),
+}
+
+
+def _pl_rollup_numpy(crop_rev, beef_rev, sheep_rev, wool_rev, other_income,
+                     crop_costs, beef_costs, sheep_costs, wool_costs, pasture_costs,
+                     overheads, depreciation, interest_expense, interest_income,
+                     tax_rate):
+    """Monthly P&L rollup from income/cost lines down to net profit
+
+    Returns (total_income, total_direct_costs, gross_profit, ebitda, ebit,
+    ebt, cumulative_taxable_income, tax_accrued, tax_expense, net_profit).
+    """
+    total_income = crop_rev + beef_rev + sheep_rev + wool_rev + other_income
+    total_direct_costs = (crop_costs + beef_costs + sheep_costs +
+                          wool_costs + pasture_costs)
+    gross_profit = total_income - total_direct_costs
+    ebitda = gross_profit - overheads
+    ebit = ebitda - depreciation
+    ebt = ebit - interest_expense + interest_income
+
+    # Tax accrual - calculated on cumulative taxable income each month
+    cumulative_taxable_income = np.cumsum(ebt)
+    tax_accrued = np.maximum(0.0, cumulative_taxable_income * tax_rate)
+    tax_expense = np.diff(tax_accrued, prepend=0.0)
+    net_profit = ebt - tax_expense
+
+    return (total_income, total_direct_costs, gross_profit, ebitda, ebit, ebt,
+            cumulative_taxable_income, tax_accrued, tax_expense, net_profit)
+
+
+def _livestock_event_arrays_py(num_months, sale_months, sale_head, sale_price, sale_weight,
+                               purchase_months, purchase_head, purchase_price):
+    """Dense monthly sales revenue and purchase cost for one livestock program
+
+    Scatters the sparse SoA movement arrays into per-month totals with
+    np.add.at; events outside the model period are dropped.
+    """
+    revenue = np.zeros(num_months)
+    purchase_cost = np.zeros(num_months)
+    sale_mask = (sale_months >= 1) & (sale_months <= num_months)
+    np.add.at(revenue, sale_months[sale_mask] - 1,
+              (sale_head * sale_price * sale_weight)[sale_mask])
+    purchase_mask = (purchase_months >= 1) & (purchase_months <= num_months)
+    np.add.at(purchase_cost, purchase_months[purchase_mask] - 1,
+              (purchase_head * purchase_price)[purchase_mask])
+    return revenue, purchase_cost
+
+
+def _cumsum_kbn_py(values: np.ndarray) -> np.ndarray:
+    """Compensated (Kahan-Babuska-Neumaier) cumulative sum
+
+    Keeps the rounding error of long mixed-sign running totals (retained
+    earnings, cumulative GST, closing cash) at O(1) instead of O(N*eps),
+    so the balance check stays clean on long horizons.
+    """
+    out = np.empty(len(values))
+    total = 0.0
+    compensation = 0.0
+    for i in range(len(values)):
+        v = values[i]
+        t = total + v
+        if abs(total) >= abs(v):
+            compensation += (total - t) + v
+        else:
+            compensation += (v - t) + total
+        total = t
+        out[i] = total + compensation
+    return out
+
+
+def _bs_rollup_numpy(cash, trade_debtors, inventory, land_water, trade_creditors,
+                     share_capital, tax_accrued, tax_paid, depreciation, capex,
+                     net_profit, net_draws, gst_payable,
+                     opening_tax_payable, opening_fixed_assets, opening_debt,
+                     opening_retained):
+    """Balance-sheet rollup from monthly flows to totals and balance check
+
+    Returns (tax_payable, fixed_assets, debt, retained_earnings,
+    gst_receivable, gst_liability, total_assets, total_liabilities,
+    total_equity, balance_check).
+    """
+    tax_payable = opening_tax_payable + tax_accrued - np.cumsum(tax_paid)
+    fixed_assets = opening_fixed_assets + np.cumsum(capex) - np.cumsum(depreciation)
+    debt = opening_debt + np.cumsum(net_draws)
+    retained_earnings = opening_retained + _cumsum_kbn_py(net_profit)
+
+    gst_receivable = np.where(gst_payable < 0, -gst_payable, 0.0)
+    gst_liability = np.where(gst_payable > 0, gst_payable, 0.0)
+
+    total_assets = (cash + trade_debtors + inventory + fixed_assets +
+                    land_water + gst_receivable)
+    total_liabilities = trade_creditors + debt + tax_payable + gst_liability
+    total_equity = share_capital + retained_earnings
+    balance_check = total_assets - (total_liabilities + total_equity)
+
+    return (tax_payable, fixed_assets, debt, retained_earnings, gst_receivable,
+            gst_liability, total_assets, total_liabilities, total_equity,
+            balance_check)
+
+
+try:
+    # With Numba available, fuse the ~9 elementwise passes into one loop;
+    # the rollup is memory-bound so this cuts traffic substantially
+    from numba import njit
+except ImportError:
+    _pl_rollup = _pl_rollup_numpy
+    _livestock_event_arrays = _livestock_event_arrays_py
+    _cumsum_kbn = _cumsum_kbn_py
+    _bs_rollup = _bs_rollup_numpy
+else:
+    _cumsum_kbn = njit(cache=True)(_cumsum_kbn_py)
+    @njit(cache=True)
+    def _livestock_event_arrays(num_months, sale_months, sale_head, sale_price, sale_weight,
+                                purchase_months, purchase_head, purchase_price):
+        # Loop form of _livestock_event_arrays_py (np.add.at is not nopython-safe)
+        revenue = np.zeros(num_months)
+        purchase_cost = np.zeros(num_months)
+        for i in range(len(sale_months)):
+            m = sale_months[i]
+            if 1 <= m <= num_months:
+                revenue[m - 1] += sale_head[i] * sale_price[i] * sale_weight[i]
+        for i in range(len(purchase_months)):
+            m = purchase_months[i]
+            if 1 <= m <= num_months:
+                purchase_cost[m - 1] += purchase_head[i] * purchase_price[i]
+        return revenue, purchase_cost
+    @njit(cache=True)
+    def _pl_rollup(crop_rev, beef_rev, sheep_rev, wool_rev, other_income,
+                   crop_costs, beef_costs, sheep_costs, wool_costs, pasture_costs,
+                   overheads, depreciation, interest_expense, interest_income,
+                   tax_rate):
+        n = crop_rev.shape[0]
+        total_income = np.empty(n)
+        total_direct_costs = np.empty(n)
+        gross_profit = np.empty(n)
+        ebitda = np.empty(n)
+        ebit = np.empty(n)
+        ebt = np.empty(n)
+        cumulative_taxable_income = np.empty(n)
+        tax_accrued = np.empty(n)
+        tax_expense = np.empty(n)
+        net_profit = np.empty(n)
+
+        cum_ebt = 0.0
+        prev_accrued = 0.0
+        for i in range(n):
+            ti = crop_rev[i] + beef_rev[i] + sheep_rev[i] + wool_rev[i] + other_income[i]
+            td = (crop_costs[i] + beef_costs[i] + sheep_costs[i] +
+                  wool_costs[i] + pasture_costs[i])
+            gp = ti - td
+            ed = gp - overheads[i]
+            eb = ed - depreciation[i]
+            et = eb - interest_expense[i] + interest_income[i]
+            cum_ebt += et
+            accrued = max(0.0, cum_ebt * tax_rate)
+            expense = accrued - prev_accrued
+            prev_accrued = accrued
+
+            total_income[i] = ti
+            total_direct_costs[i] = td
+            gross_profit[i] = gp
+            ebitda[i] = ed
+            ebit[i] = eb
+            ebt[i] = et
+            cumulative_taxable_income[i] = cum_ebt
+            tax_accrued[i] = accrued
+            tax_expense[i] = expense
+            net_profit[i] = et - expense
+
+        return (total_income, total_direct_costs, gross_profit, ebitda, ebit, ebt,
+                cumulative_taxable_income, tax_accrued, tax_expense, net_profit)
+
+    @njit(cache=True)
+    def _bs_rollup(cash, trade_debtors, inventory, land_water, trade_creditors,
+                   share_capital, tax_accrued, tax_paid, depreciation, capex,
+                   net_profit, net_draws, gst_payable,
+                   opening_tax_payable, opening_fixed_assets, opening_debt,
+                   opening_retained):
+        # Loop form of _bs_rollup_numpy: one pass carrying the running sums
+        # (tax paid, capex, depreciation, debt) and the KBN-compensated
+        # retained-earnings total
+        n = cash.shape[0]
+        tax_payable = np.empty(n)
+        fixed_assets = np.empty(n)
+        debt = np.empty(n)
+        retained_earnings = np.empty(n)
+        gst_receivable = np.empty(n)
+        gst_liability = np.empty(n)
+        total_assets = np.empty(n)
+        total_liabilities = np.empty(n)
+        total_equity = np.empty(n)
+        balance_check = np.empty(n)
+
+        cum_tax_paid = 0.0
+        cum_capex = 0.0
+        cum_dep = 0.0
+        cum_draws = 0.0
+        profit_total = 0.0
+        profit_comp = 0.0
+        for i in range(n):
+            cum_tax_paid += tax_paid[i]
+            cum_capex += capex[i]
+            cum_dep += depreciation[i]
+            cum_draws += net_draws[i]
+
+            v = net_profit[i]
+            t = profit_total + v
+            if abs(profit_total) >= abs(v):
+                profit_comp += (profit_total - t) + v
+            else:
+                profit_comp += (v - t) + profit_total
+            profit_total = t
+
+            tp = opening_tax_payable + tax_accrued[i] - cum_tax_paid
+            fa = opening_fixed_assets + cum_capex - cum_dep
+            db = opening_debt + cum_draws
+            re = opening_retained + profit_total + profit_comp
+            gst = gst_payable[i]
+            gr = -gst if gst < 0 else 0.0
+            gl = gst if gst > 0 else 0.0
+
+            ta = cash[i] + trade_debtors[i] + inventory[i] + fa + land_water[i] + gr
+            tl = trade_creditors[i] + db + tp + gl
+            te = share_capital[i] + re
+
+            tax_payable[i] = tp
+            fixed_assets[i] = fa
+            debt[i] = db
+            retained_earnings[i] = re
+            gst_receivable[i] = gr
+            gst_liability[i] = gl
+            total_assets[i] = ta
+            total_liabilities[i] = tl
+            total_equity[i] = te
+            balance_check[i] = ta - (tl + te)
+
+        return (tax_payable, fixed_assets, debt, retained_earnings, gst_receivable,
+                gst_liability, total_assets, total_liabilities, total_equity,
+                balance_check)
+
+
 class FarmModel:
     """Main farm financial model calculation engine"""
     
@@ -731,6 +1226,10 @@ class FarmModel:
         self.overheads: List[OverheadCategory] = []
         self.debt_facilities: List[DebtFacility] = []
         
+        # Result frame backend: 'pandas' (default) or 'polars' (opt-in,
+        # requires polars to be installed)
+        self.backend = 'pandas'
+
         # Results storage
         self.monthly_pl: pd.DataFrame = None
         self.monthly_bs: pd.DataFrame = None
@@ -757,25 +1256,33 @@ class FarmModel:
             'month': months,
             'date': month_dates,
             # Income
-            'crop_revenue': [0.0] * num_months,
-            'beef_revenue': [0.0] * num_months,
-            'sheep_revenue': [0.0] * num_months,
-            'wool_revenue': [0.0] * num_months,
-            'other_income': [0.0] * num_months,
+            'crop_revenue': np.zeros(num_months),
+            'beef_revenue': np.zeros(num_months),
+            'sheep_revenue': np.zeros(num_months),
+            'wool_revenue': np.zeros(num_months),
+            'other_income': np.zeros(num_months),
             # Direct costs
-            'crop_direct_costs': [0.0] * num_months,
-            'beef_direct_costs': [0.0] * num_months,
-            'sheep_direct_costs': [0.0] * num_months,
-            'wool_direct_costs': [0.0] * num_months,
-            'pasture_costs': [0.0] * num_months,
+            'crop_direct_costs': np.zeros(num_months),
+            'beef_direct_costs': np.zeros(num_months),
+            'sheep_direct_costs': np.zeros(num_months),
+            'wool_direct_costs': np.zeros(num_months),
+            'pasture_costs': np.zeros(num_months),
             # Overheads
-            'overheads': [0.0] * num_months,
+            'overheads': np.zeros(num_months),
             # Other
-            'depreciation': [0.0] * num_months,
-            'interest_expense': [0.0] * num_months,
-            'interest_income': [0.0] * num_months,
+            'depreciation': np.zeros(num_months),
+            'interest_expense': np.zeros(num_months),
+            'interest_income': np.zeros(num_months),
         }
         
+        # Materialize planned CAPEX as fixed assets up-front so depreciation
+        # can include them from their purchase month (the cash outflow is
+        # still recorded in the cash flow pass)
+        purchase_dates = pd.date_range(self.general.start_date, periods=num_months,
+                                       freq=pd.DateOffset(months=1))
+        capex_in_period = [c for c in self.planned_capex if 1 <= c.purchase_month <= num_months]
+        self.fixed_assets.extend(PlannedCapex.bulk_to_fixed_assets(capex_in_period, purchase_dates))
+
         # Calculate enterprise revenues and costs
         self._calculate_crop_enterprise(pl_data)
         self._calculate_livestock_enterprises(pl_data)
@@ -784,72 +1291,87 @@ class FarmModel:
         self._calculate_depreciation(pl_data)
         self._calculate_debt_costs(pl_data)
         
-        # Build P&L
-        df_pl = pd.DataFrame(pl_data)
-        
-        # Total income
-        df_pl['total_income'] = (df_pl['crop_revenue'] + df_pl['beef_revenue'] + 
-                                  df_pl['sheep_revenue'] + df_pl['wool_revenue'] + 
-                                  df_pl['other_income'])
-        
-        # Total direct costs
-        df_pl['total_direct_costs'] = (df_pl['crop_direct_costs'] + df_pl['beef_direct_costs'] + 
-                                        df_pl['sheep_direct_costs'] + df_pl['wool_direct_costs'] + 
-                                        df_pl['pasture_costs'])
-        
-        # Gross profit
-        df_pl['gross_profit'] = df_pl['total_income'] - df_pl['total_direct_costs']
-        
-        # EBITDA
-        df_pl['ebitda'] = df_pl['gross_profit'] - df_pl['overheads']
-        
-        # EBIT
-        df_pl['ebit'] = df_pl['ebitda'] - df_pl['depreciation']
-        
-        # EBT
-        df_pl['ebt'] = df_pl['ebit'] - df_pl['interest_expense'] + df_pl['interest_income']
-        
-        # Tax accrual - calculate on cumulative taxable income each month
-        df_pl['cumulative_taxable_income'] = df_pl['ebt'].cumsum()
-        df_pl['tax_accrued'] = df_pl['cumulative_taxable_income'].apply(
-            lambda x: max(0, x * self.general.income_tax_rate)
-        )
-        
+        # Roll the income/cost lines down to net profit in one fused kernel
+        (total_income, total_direct_costs, gross_profit, ebitda, ebit, ebt,
+         cumulative_taxable_income, tax_accrued, tax_expense, net_profit) = _pl_rollup(
+            pl_data['crop_revenue'], pl_data['beef_revenue'], pl_data['sheep_revenue'],
+            pl_data['wool_revenue'], pl_data['other_income'],
+            pl_data['crop_direct_costs'], pl_data['beef_direct_costs'],
+            pl_data['sheep_direct_costs'], pl_data['wool_direct_costs'],
+            pl_data['pasture_costs'], pl_data['overheads'], pl_data['depreciation'],
+            pl_data['interest_expense'], pl_data['interest_income'],
+            self.general.income_tax_rate)
+
+        pl_data['total_income'] = total_income
+        pl_data['total_direct_costs'] = total_direct_costs
+        pl_data['gross_profit'] = gross_profit
+        pl_data['ebitda'] = ebitda
+        pl_data['ebit'] = ebit
+        pl_data['ebt'] = ebt
+        pl_data['cumulative_taxable_income'] = cumulative_taxable_income
+        pl_data['tax_accrued'] = tax_accrued
+
         # Tax payment only in tax payment month (reduces cash)
-        df_pl['tax_paid'] = 0.0
+        tax_paid = np.zeros(num_months)
         tax_month = self.general.tax_payment_month
         if tax_month <= num_months:
             # Pay tax accrued to date
-            tax_to_pay = df_pl.iloc[tax_month - 1]['tax_accrued']
-            if tax_to_pay > 0:
-                df_pl.loc[tax_month - 1, 'tax_paid'] = tax_to_pay
-        
+            tax_paid[tax_month - 1] = tax_accrued[tax_month - 1]
+        pl_data['tax_paid'] = tax_paid
+
         # Tax expense for P&L is based on full year position
         # For monthly P&L, accrue progressively
-        df_pl['tax_expense'] = df_pl['tax_accrued'] - df_pl['tax_accrued'].shift(1).fillna(0)
-        
+        pl_data['tax_expense'] = tax_expense
+
         # Net profit (after tax expense)
-        df_pl['net_profit'] = df_pl['ebt'] - df_pl['tax_expense']
-        
+        pl_data['net_profit'] = net_profit
+
+        # Build P&L in one columnwise shot from the completed array dict; the
+        # same arrays are threaded into the cash flow and GST passes so they
+        # consume typed ndarrays instead of re-extracting columns
+        df_pl = pd.DataFrame(pl_data)
+
         self.monthly_pl = df_pl
         
         # Build cash flow
-        self._calculate_cash_flow(df_pl)
-        
+        self._calculate_cash_flow(df_pl, pl_data)
+
         # Calculate interest income on positive cash (now that we know cash balances)
         self._calculate_interest_income(df_pl)
-        
+
         # Calculate GST
-        self._calculate_gst(df_pl)
+        self._calculate_gst(df_pl, pl_data)
         
         # Build balance sheet
         self._calculate_balance_sheet(df_pl)
         
         # Summarize to annual
         self._summarize_annual()
-        
+
+        # Convert result frames to the requested backend
+        if self.backend == 'polars':
+            self._convert_results_to_polars()
+
         print("Calculation complete.")
         return self.monthly_pl, self.monthly_bs, self.monthly_cf
+
+    def _convert_results_to_polars(self):
+        """Swap the result frames over to polars DataFrames
+
+        The engine itself computes on numpy arrays, so polars is offered
+        purely as an output format for downstream consumers that work in
+        its ecosystem; there is no lazy query graph to fuse here.
+        """
+        try:
+            import polars as pl
+        except ImportError:
+            raise ImportError(
+                "backend='polars' requires the polars package to be installed")
+        for attr in ('monthly_pl', 'monthly_bs', 'monthly_cf', 'monthly_gst',
+                     'annual_pl', 'annual_bs', 'annual_cf'):
+            frame = getattr(self, attr)
+            if frame is not None:
+                setattr(self, attr, pl.from_pandas(frame))
     
     def _calculate_crop_enterprise(self, pl_data: Dict):
         """Calculate cropping revenues and costs"""
@@ -871,108 +1393,145 @@ class FarmModel:
     def _calculate_livestock_enterprises(self, pl_data: Dict):
         """Calculate livestock revenues and costs with stock reconciliation and wool"""
         num_months = len(pl_data['month'])
-        
+
+        # Name lookups, built once for all programs
+        class_by_name = {lc.class_name: lc for lc in self.livestock_classes}
+        wool_by_program = {wp.program_name: wp for wp in self.wool_production}
+
         for program in self.livestock_programs:
             # Calculate stock reconciliation
             stock_recon = program.calculate_stock_reconciliation(num_months)
             self.stock_reconciliation[program.program_name] = stock_recon
-            
+
+            # Closing head by month (recon rows are ordered by month)
+            closing_arr = stock_recon['closing'].to_numpy()
+
             # Find associated livestock class
-            livestock_class = None
-            for lc in self.livestock_classes:
-                if lc.class_name == program.livestock_class:
-                    livestock_class = lc
-                    break
-            
-            for month in range(1, num_months + 1):
-                # Sales revenue (meat)
-                if month in program.sales_by_month:
-                    head, price_per_kg, avg_weight = program.sales_by_month[month]
-                    revenue = head * price_per_kg * avg_weight
-                    if program.enterprise_type == 'beef':
-                        pl_data['beef_revenue'][month - 1] += revenue
-                    elif program.enterprise_type == 'sheep':
-                        pl_data['sheep_revenue'][month - 1] += revenue
-                
-                # Purchase costs (goes to P&L as direct cost)
-                if month in program.purchases_by_month:
-                    head, price = program.purchases_by_month[month]
-                    cost = head * price
-                    if program.enterprise_type == 'beef':
-                        pl_data['beef_direct_costs'][month - 1] += cost
-                    elif program.enterprise_type == 'sheep':
-                        pl_data['sheep_direct_costs'][month - 1] += cost
-                
-                # Direct costs (animal health, fodder, etc.)
-                if month in program.direct_costs_by_month:
-                    for category, amount in program.direct_costs_by_month[month].items():
-                        if program.enterprise_type == 'beef':
-                            pl_data['beef_direct_costs'][month - 1] += amount
-                        elif program.enterprise_type == 'sheep':
-                            pl_data['sheep_direct_costs'][month - 1] += amount
-                
-                # Wool production and sales (for sheep only)
-                if program.enterprise_type == 'sheep' and livestock_class and livestock_class.produces_wool:
-                    # Find wool production record for this program
-                    wool_prod = None
-                    for wp in self.wool_production:
-                        if wp.program_name == program.program_name:
-                            wool_prod = wp
-                            break
-                    
-                    if wool_prod:
+            livestock_class = class_by_name.get(program.livestock_class)
+
+            # Sales revenue (meat) and purchase costs (a P&L direct cost),
+            # scattered into dense monthly arrays from the SoA movement arrays
+            revenue_arr, purchase_arr = _livestock_event_arrays(
+                num_months, program._sale_months, program._sale_head,
+                program._sale_price, program._sale_weight,
+                program._purchase_months, program._purchase_head, program._purchase_price)
+
+            # Direct costs (animal health, fodder, etc.)
+            direct_arr = np.zeros(num_months)
+            if program.direct_costs_by_month:
+                cost_months = np.fromiter(program.direct_costs_by_month.keys(), dtype=np.int64)
+                cost_totals = np.fromiter(
+                    (sum(categories.values())
+                     for categories in program.direct_costs_by_month.values()),
+                    dtype=np.float64, count=len(cost_months))
+                in_period = (cost_months >= 1) & (cost_months <= num_months)
+                np.add.at(direct_arr, cost_months[in_period] - 1, cost_totals[in_period])
+
+            # Resolve the target columns once from the enterprise type map
+            enterprise_cols = ENTERPRISE_COLS.get(program.enterprise_type)
+            if enterprise_cols:
+                rev_col, cost_col = enterprise_cols
+                pl_data[rev_col] += revenue_arr
+                pl_data[cost_col] += purchase_arr + direct_arr
+
+            # Wool production and sales (for sheep only)
+            if program.enterprise_type == 'sheep' and livestock_class and livestock_class.produces_wool:
+                # Find wool production record for this program
+                wool_prod = wool_by_program.get(program.program_name)
+
+                if wool_prod:
+                    for month in range(1, num_months + 1):
                         # Get sheep count for this month
-                        month_recon = stock_recon[stock_recon['month'] == month]
-                        if len(month_recon) > 0:
-                            sheep_count = int(month_recon.iloc[0]['closing'])
-                            
-                            # Calculate wool production if shearing month
-                            wool_prod.calculate_monthly_production(sheep_count, livestock_class, month)
-                            
-                            # Calculate wool revenue if sale month
-                            wool_revenue = wool_prod.calculate_wool_revenue(month)
-                            pl_data['wool_revenue'][month - 1] += wool_revenue
-                            
-                            # Calculate shearing costs
-                            shearing_cost = wool_prod.calculate_shearing_costs(sheep_count, month, livestock_class)
-                            pl_data['wool_direct_costs'][month - 1] += shearing_cost
+                        sheep_count = int(closing_arr[month - 1])
+
+                        # Calculate wool production if shearing month
+                        wool_prod.calculate_monthly_production(sheep_count, livestock_class, month)
+
+                        # Calculate wool revenue if sale month
+                        wool_revenue = wool_prod.calculate_wool_revenue(month)
+                        pl_data['wool_revenue'][month - 1] += wool_revenue
+
+                        # Calculate shearing costs
+                        shearing_cost = wool_prod.calculate_shearing_costs(sheep_count, month, livestock_class)
+                        pl_data['wool_direct_costs'][month - 1] += shearing_cost
     
     def _calculate_overheads(self, pl_data: Dict):
         """Calculate overhead costs"""
         num_months = len(pl_data['month'])
-        
-        for overhead in self.overheads:
-            for month in range(1, num_months + 1):
-                cost = overhead.get_monthly_cost(month)
-                pl_data['overheads'][month - 1] += cost
-    
+
+        if self.overheads:
+            pl_data['overheads'] += np.sum(
+                [overhead.monthly_cost_array(num_months) for overhead in self.overheads],
+                axis=0)
+
     def _calculate_pasture_programs(self, pl_data: Dict):
         """Calculate pasture program costs"""
         num_months = len(pl_data['month'])
-        
-        for program in self.pasture_programs:
-            for month in range(1, num_months + 1):
-                cost = program.get_monthly_costs(month)
-                pl_data['pasture_costs'][month - 1] += cost
-    
+
+        if self.pasture_programs:
+            pl_data['pasture_costs'] += np.sum(
+                [program.monthly_cost_array(num_months) for program in self.pasture_programs],
+                axis=0)
+
+    def fixed_assets_arrays(self) -> Dict:
+        """Struct-of-arrays view of the fixed asset register
+
+        Returns names plus cost, annual/monthly straight-line depreciation
+        and the 1-based model month each asset starts depreciating (clamped
+        to 1 for assets purchased before the model start). Shared by the
+        depreciation pass and reporting so neither loops per asset.
+        """
+        assets = self.fixed_assets
+        start = self.general.start_date
+        cost = np.array([a.purchase_amount for a in assets], dtype=np.float64)
+        residual = np.array([a.residual_value for a in assets], dtype=np.float64)
+        life = np.array([a.useful_life_years for a in assets], dtype=np.float64)
+        straight_line = np.array([a.depreciation_method == 'straight_line'
+                                  for a in assets], dtype=bool)
+        annual_dep = np.zeros(len(assets))
+        np.divide(cost - residual, life, out=annual_dep, where=straight_line)
+        start_month = np.array([
+            max(1, (a.purchase_date.year - start.year) * 12 +
+                (a.purchase_date.month - start.month) + 1)
+            for a in assets], dtype=np.int64)
+        return {
+            'name': [a.asset_name for a in assets],
+            'cost': cost,
+            'annual_depreciation': annual_dep,
+            'monthly_depreciation': annual_dep / 12.0,
+            'start_month': start_month,
+        }
+
     def _calculate_depreciation(self, pl_data: Dict):
-        """Calculate depreciation from fixed assets"""
+        """Calculate depreciation from fixed assets
+
+        Assets purchased during the model period (planned CAPEX) only
+        depreciate from their purchase month onwards; pre-existing assets
+        depreciate in every month.
+        """
+        if not self.fixed_assets:
+            return
         num_months = len(pl_data['month'])
-        
-        for asset in self.fixed_assets:
-            monthly_dep = asset.calculate_monthly_depreciation()
-            for month in range(num_months):
-                pl_data['depreciation'][month] += monthly_dep
-    
+        arrays = self.fixed_assets_arrays()
+
+        # (asset x month) active mask, collapsed to one depreciation series
+        months = np.arange(1, num_months + 1)
+        active = months[None, :] >= arrays['start_month'][:, None]
+        pl_data['depreciation'] += (arrays['monthly_depreciation'][:, None] *
+                                    active).sum(axis=0)
+
     def _calculate_debt_costs(self, pl_data: Dict):
         """Calculate interest on debt and interest income on cash"""
         num_months = len(pl_data['month'])
-        
-        # Interest expense on debt
-        for facility in self.debt_facilities:
-            for month in range(1, num_months + 1):
-                interest = facility.calculate_interest(month)
-                pl_data['interest_expense'][month - 1] += interest
+
+        # Interest expense on debt (dense per-facility series, one prefix sum
+        # each, summed across facilities in a single reduction)
+        if self.debt_facilities:
+            for facility in self.debt_facilities:
+                facility.prepare(num_months)  # refresh in case schedules changed
+            pl_data['interest_expense'] += np.sum(
+                [facility.interest_series(num_months) for facility in self.debt_facilities],
+                axis=0)
         
         # Interest income on positive cash balances
         # This is calculated after cash flow is built, so we'll add it there
@@ -981,251 +1540,188 @@ class FarmModel:
         """Calculate interest income on positive cash balances"""
         if self.monthly_cf is None:
             return
-        
-        num_months = len(df_pl)
+
         monthly_rate = self.general.cash_interest_rate / 12
-        
-        for month_idx in range(num_months):
-            cash_balance = self.monthly_cf.iloc[month_idx]['closing_cash']
-            if cash_balance > 0:
-                interest_income = cash_balance * monthly_rate
-                df_pl.loc[month_idx, 'interest_income'] += interest_income
+        cash = self.monthly_cf['closing_cash'].to_numpy()
+        interest = np.where(cash > 0, cash * monthly_rate, 0.0)
+        df_pl['interest_income'] = df_pl['interest_income'].to_numpy() + interest
     
-    def _calculate_gst(self, df_pl: pd.DataFrame):
+    def _calculate_gst(self, df_pl: pd.DataFrame, pl_arrays: Dict[str, np.ndarray]):
         """Calculate GST on revenues and expenses with payment timing"""
         num_months = len(df_pl)
         gst_rate = self.general.gst_rate
-        
-        gst_on_sales = []
-        gst_on_purchases = []
-        net_gst_list = []
-        gst_payments = [0.0] * num_months
-        
-        for month_idx in range(num_months):
-            # GST collected on sales
-            total_revenue = (df_pl.iloc[month_idx]['crop_revenue'] +
-                           df_pl.iloc[month_idx]['beef_revenue'] +
-                           df_pl.iloc[month_idx]['sheep_revenue'] +
-                           df_pl.iloc[month_idx]['wool_revenue'] +
-                           df_pl.iloc[month_idx]['other_income'])
-            gst_collected = total_revenue * gst_rate
-            
-            # GST paid on purchases
-            total_expenses = (df_pl.iloc[month_idx]['crop_direct_costs'] +
-                            df_pl.iloc[month_idx]['beef_direct_costs'] +
-                            df_pl.iloc[month_idx]['sheep_direct_costs'] +
-                            df_pl.iloc[month_idx]['wool_direct_costs'] +
-                            df_pl.iloc[month_idx]['pasture_costs'] +
-                            df_pl.iloc[month_idx]['overheads'])
-            gst_paid = total_expenses * gst_rate
-            
-            # Net GST (positive = payable, negative = receivable)
-            net_gst = gst_collected - gst_paid
-            
-            gst_on_sales.append(gst_collected)
-            gst_on_purchases.append(gst_paid)
-            net_gst_list.append(net_gst)
-        
-        gst_data = {
-            'month': df_pl['month'].tolist(),
-            'date': df_pl['date'].tolist(),
-            'gst_on_sales': gst_on_sales,
-            'gst_on_purchases': gst_on_purchases,
-            'net_gst': net_gst_list,
-            'gst_payment': gst_payments
-        }
-        
-        df_gst = pd.DataFrame(gst_data)
-        
-        # Calculate GST payments based on reporting period
+
+        # GST collected on sales / paid on purchases, one column expression each
+        gst_on_sales = sum(pl_arrays[col] for col in REV_COLS) * gst_rate
+        gst_on_purchases = sum(pl_arrays[col] for col in EXP_COLS) * gst_rate
+
+        # Net GST (positive = payable, negative = receivable)
+        net_gst = gst_on_sales - gst_on_purchases
+
+        # Calculate GST payments based on reporting period, all on ndarrays;
+        # the DataFrame is only assembled once at the end
+        payments = np.zeros(num_months)
         payment_months = self.general.get_gst_payment_months()
-        
+        delay = self.general.gst_payment_delay
+
         if self.general.gst_reporting_period == "quarterly":
-            # Pay quarterly GST in payment months
-            for payment_month in payment_months:
-                if payment_month <= num_months:
-                    # Calculate which quarter we're paying for
-                    quarter_end = payment_month - self.general.gst_payment_delay
+            payment_arr = np.array([m for m in payment_months if m <= num_months], dtype=int)
+            if num_months % 3 == 0 and len(payment_arr) > 0:
+                # Whole quarters: one reshape+sum, then scatter into payment months
+                quarter_totals = net_gst.reshape(-1, 3).sum(axis=1)
+                quarter_idx = (payment_arr - delay) // 3 - 1
+                # Only pay if positive (payable)
+                payments[payment_arr - 1] = np.maximum(quarter_totals[quarter_idx], 0)
+            else:
+                # Partial quarters at the horizon: fall back to per-payment sums
+                for payment_month in payment_arr:
+                    quarter_end = payment_month - delay
                     quarter_start = max(1, quarter_end - 2)
-                    
-                    # Sum GST for the quarter
-                    quarter_gst = df_gst.loc[(df_gst['month'] >= quarter_start) & 
-                                             (df_gst['month'] <= quarter_end), 'net_gst'].sum()
-                    
+                    quarter_gst = net_gst[quarter_start - 1:quarter_end].sum()
                     if quarter_gst > 0:  # Only pay if positive (payable)
-                        df_gst.loc[df_gst['month'] == payment_month, 'gst_payment'] = quarter_gst
-        
+                        payments[payment_month - 1] = quarter_gst
+
         elif self.general.gst_reporting_period == "monthly":
-            # Pay monthly GST
-            for month in range(1, num_months + 1):
-                payment_month = month + self.general.gst_payment_delay
-                if payment_month <= num_months:
-                    month_gst = df_gst.loc[df_gst['month'] == month, 'net_gst'].values[0]
-                    if month_gst > 0:
-                        df_gst.loc[df_gst['month'] == payment_month, 'gst_payment'] = month_gst
-        
+            # Pay each month's positive net GST after the delay
+            if 0 <= delay < num_months:
+                accrued = net_gst[:num_months - delay]
+                payments[delay:] = np.maximum(accrued, 0)
+
         elif self.general.gst_reporting_period == "annual":
             # Pay annual GST
             if payment_months:
                 payment_month = payment_months[0]
                 if payment_month <= num_months:
-                    annual_gst = df_gst['net_gst'].sum()
+                    annual_gst = net_gst.sum()
                     if annual_gst > 0:
-                        df_gst.loc[df_gst['month'] == payment_month, 'gst_payment'] = annual_gst
-        
-        # Calculate cumulative GST liability (unpaid)
-        df_gst['cumulative_gst'] = self.opening_balances.gst_liability
-        for idx in range(len(df_gst)):
-            if idx > 0:
-                df_gst.loc[idx, 'cumulative_gst'] = df_gst.loc[idx-1, 'cumulative_gst']
-            df_gst.loc[idx, 'cumulative_gst'] += df_gst.loc[idx, 'net_gst'] - df_gst.loc[idx, 'gst_payment']
-        
-        self.monthly_gst = df_gst
+                        payments[payment_month - 1] = annual_gst
+
+        # Cumulative GST liability (unpaid) - a compensated prefix sum off
+        # the opening position
+        cumulative_gst = (self.opening_balances.gst_liability +
+                          _cumsum_kbn(net_gst - payments))
+
+        self.monthly_gst = pd.DataFrame({
+            'month': df_pl['month'].tolist(),
+            'date': df_pl['date'].tolist(),
+            'gst_on_sales': gst_on_sales,
+            'gst_on_purchases': gst_on_purchases,
+            'net_gst': net_gst,
+            'gst_payment': payments,
+            'cumulative_gst': cumulative_gst
+        })
     
-    def _calculate_cash_flow(self, df_pl: pd.DataFrame):
-        """Build cash flow statement with payment timing"""
+    def _calculate_cash_flow(self, df_pl: pd.DataFrame, pl_arrays: Dict[str, np.ndarray]):
+        """Build cash flow statement with payment timing
+
+        pl_arrays is the typed ndarray view of the P&L (the accumulators plus
+        rollup outputs); df_pl supplies only the month/date labels.
+        """
         num_months = len(df_pl)
-        
-        # Initialize arrays for cash timing
-        cash_receipts = [0.0] * num_months
-        cash_payments = [0.0] * num_months
-        
+
+        crop_rev = pl_arrays['crop_revenue']
+        beef_rev = pl_arrays['beef_revenue']
+        sheep_rev = pl_arrays['sheep_revenue']
+        wool_rev = pl_arrays['wool_revenue']
+        crop_costs = pl_arrays['crop_direct_costs']
+        beef_costs = pl_arrays['beef_direct_costs']
+        sheep_costs = pl_arrays['sheep_direct_costs']
+        overhead_costs = pl_arrays['overheads']
+        pasture_costs = pl_arrays['pasture_costs']
+
+        def timed_total(buckets: List[Tuple[np.ndarray, int]]) -> np.ndarray:
+            """Sum (accrual series, timing offset) buckets into a cash series
+
+            Buckets sharing an offset are pre-summed, then each distinct
+            offset is applied as one matmul against a shift matrix
+            (eye(N, k=offset)); amounts shifted past the horizon drop out.
+            """
+            by_offset: Dict[int, np.ndarray] = {}
+            for values, offset in buckets:
+                if 0 <= offset < num_months:
+                    if offset in by_offset:
+                        by_offset[offset] = by_offset[offset] + values
+                    else:
+                        by_offset[offset] = values
+            total = np.zeros(num_months)
+            for offset, accrual in by_offset.items():
+                if offset == 0:
+                    total += accrual
+                else:
+                    total += accrual @ np.eye(num_months, k=offset)
+            return total
+
         # Apply payment timing to revenues (including GST on receipts)
         gst_rate = self.general.gst_rate
-        for month in range(num_months):
-            # Crop sales - delayed by crop_sales timing
-            crop_rev_accrual = df_pl.iloc[month]['crop_revenue']
-            crop_rev_incl_gst = crop_rev_accrual * (1 + gst_rate)  # Add GST
-            cash_month = month + self.payment_timing.crop_sales
-            if cash_month < num_months:
-                cash_receipts[cash_month] += crop_rev_incl_gst
-            
-            # Beef sales - delayed by beef_sales timing  
-            beef_rev_accrual = df_pl.iloc[month]['beef_revenue']
-            beef_rev_incl_gst = beef_rev_accrual * (1 + gst_rate)
-            cash_month = month + self.payment_timing.beef_sales
-            if cash_month < num_months:
-                cash_receipts[cash_month] += beef_rev_incl_gst
-            
-            # Sheep sales - delayed by sheep_sales timing
-            sheep_rev_accrual = df_pl.iloc[month]['sheep_revenue']
-            sheep_rev_incl_gst = sheep_rev_accrual * (1 + gst_rate)
-            cash_month = month + self.payment_timing.sheep_sales
-            if cash_month < num_months:
-                cash_receipts[cash_month] += sheep_rev_incl_gst
-            
-            # Wool sales - delayed by wool_sales timing
-            wool_rev_accrual = df_pl.iloc[month]['wool_revenue']
-            wool_rev_incl_gst = wool_rev_accrual * (1 + gst_rate)
-            cash_month = month + self.payment_timing.wool_sales
-            if cash_month < num_months:
-                cash_receipts[cash_month] += wool_rev_incl_gst
-        
-        # Apply payment timing to costs (including GST on payments)
-        for month in range(num_months):
-            # Direct costs - various timing
-            crop_cost_accrual = df_pl.iloc[month]['crop_direct_costs']
-            crop_cost_incl_gst = crop_cost_accrual * (1 + gst_rate)
-            cash_month = month + self.payment_timing.crop_fertiliser  # Simplified
-            if cash_month < num_months:
-                cash_payments[cash_month] += crop_cost_incl_gst
-            
-            beef_cost_accrual = df_pl.iloc[month]['beef_direct_costs']
-            beef_cost_incl_gst = beef_cost_accrual * (1 + gst_rate)
-            cash_month = month + self.payment_timing.beef_animal_health  # Simplified
-            if cash_month < num_months:
-                cash_payments[cash_month] += beef_cost_incl_gst
-            
-            sheep_cost_accrual = df_pl.iloc[month]['sheep_direct_costs']
-            sheep_cost_incl_gst = sheep_cost_accrual * (1 + gst_rate)
-            cash_month = month + self.payment_timing.sheep_animal_health  # Simplified
-            if cash_month < num_months:
-                cash_payments[cash_month] += sheep_cost_incl_gst
-            
-            # Overheads - typically paid in month
-            overhead_cost = df_pl.iloc[month]['overheads']
-            overhead_cost_incl_gst = overhead_cost * (1 + gst_rate)
-            cash_month = month + self.payment_timing.overhead_default
-            if cash_month < num_months:
-                cash_payments[cash_month] += overhead_cost_incl_gst
-            
-            # Pasture costs
-            pasture_cost = df_pl.iloc[month]['pasture_costs']
-            pasture_cost_incl_gst = pasture_cost * (1 + gst_rate)
-            if cash_month < num_months:
-                cash_payments[cash_month] += pasture_cost_incl_gst
-            
-            # Interest - paid in month
-            interest_cost = df_pl.iloc[month]['interest_expense']
-            if month < num_months:
-                cash_payments[month] += interest_cost
-        
+        timing = self.payment_timing
+        cash_receipts = timed_total([
+            (crop_rev * (1 + gst_rate), timing.crop_sales),
+            (beef_rev * (1 + gst_rate), timing.beef_sales),
+            (sheep_rev * (1 + gst_rate), timing.sheep_sales),
+            (wool_rev * (1 + gst_rate), timing.wool_sales),
+        ])
+
+        # Apply payment timing to costs (including GST on payments) - simplified
+        # to one representative timing per bucket, as before; overheads and
+        # pasture costs are typically paid in month
+        cash_payments = timed_total([
+            (crop_costs * (1 + gst_rate), timing.crop_fertiliser),
+            (beef_costs * (1 + gst_rate), timing.beef_animal_health),
+            (sheep_costs * (1 + gst_rate), timing.sheep_animal_health),
+            (overhead_costs * (1 + gst_rate), timing.overhead_default),
+            (pasture_costs * (1 + gst_rate), timing.overhead_default),
+        ])
+
+        # Interest - paid in month
+        cash_payments += pl_arrays['interest_expense']
+
         # Calculate working capital changes
-        working_capital_change = [0.0] * num_months
-        for month in range(num_months):
-            # Debtors increase when revenue > receipts
-            accrual_revenue = (df_pl.iloc[month]['crop_revenue'] + 
-                              df_pl.iloc[month]['beef_revenue'] + 
-                              df_pl.iloc[month]['sheep_revenue'] + 
-                              df_pl.iloc[month]['wool_revenue'])
-            debtor_change = accrual_revenue - cash_receipts[month]
-            
-            # Creditors increase when costs > payments
-            accrual_costs = (df_pl.iloc[month]['crop_direct_costs'] + 
-                            df_pl.iloc[month]['beef_direct_costs'] + 
-                            df_pl.iloc[month]['sheep_direct_costs'] + 
-                            df_pl.iloc[month]['overheads'])
-            creditor_change = accrual_costs - cash_payments[month]
-            
-            # Net working capital change (increase in WC = cash outflow)
-            working_capital_change[month] = debtor_change - creditor_change
+        # Debtors increase when revenue > receipts; creditors when costs > payments
+        accrual_revenue = crop_rev + beef_rev + sheep_rev + wool_rev
+        accrual_costs = crop_costs + beef_costs + sheep_costs + overhead_costs
+        debtor_change = accrual_revenue - cash_receipts
+        creditor_change = accrual_costs - cash_payments
+
+        # Net working capital change (increase in WC = cash outflow)
+        working_capital_change = debtor_change - creditor_change
         
         cf_data = {
             'month': df_pl['month'].tolist(),
             'date': df_pl['date'].tolist(),
-            'net_profit': df_pl['net_profit'].tolist(),
-            'depreciation': df_pl['depreciation'].tolist(),
+            'net_profit': pl_arrays['net_profit'],
+            'depreciation': pl_arrays['depreciation'],
             'working_capital_change': working_capital_change,
             'cash_receipts': cash_receipts,
             'cash_payments': cash_payments,
-            'capex': [0.0] * num_months,
-            'asset_sales': [0.0] * num_months,
-            'debt_drawdowns': [0.0] * num_months,
-            'debt_repayments': [0.0] * num_months,
-            'equity_injection': [0.0] * num_months,
-            'dividends': [0.0] * num_months,
+            'capex': np.zeros(num_months),
+            'asset_sales': np.zeros(num_months),
+            'debt_drawdowns': np.zeros(num_months),
+            'debt_repayments': np.zeros(num_months),
+            'equity_injection': np.zeros(num_months),
+            'dividends': np.zeros(num_months),
         }
         
-        # Add debt facility movements
+        # Add debt facility movements from the facilities' prepared dense
+        # schedules - one vector add per facility instead of a month loop
         for facility in self.debt_facilities:
-            for month in range(1, num_months + 1):
-                if month in facility.drawdown_schedule:
-                    cf_data['debt_drawdowns'][month - 1] += facility.drawdown_schedule[month]
-                if month in facility.repayment_schedule:
-                    cf_data['debt_repayments'][month - 1] += facility.repayment_schedule[month]
+            draws, repays = facility.as_arrays(num_months)
+            cf_data['debt_drawdowns'] += draws
+            cf_data['debt_repayments'] += repays
         
         # Add GST payments (reduce cash when paying to ATO)
         if self.monthly_gst is not None:
-            for month_idx in range(num_months):
-                gst_payment = self.monthly_gst.iloc[month_idx]['gst_payment']
-                if gst_payment > 0:
-                    cash_payments[month_idx] += gst_payment
-        
+            gst_payments = self.monthly_gst['gst_payment'].to_numpy()
+            cash_payments += np.maximum(gst_payments, 0.0)
+
         # Add tax payments (only when actually paid, not when accrued)
-        for month_idx in range(num_months):
-            tax_payment = df_pl.iloc[month_idx]['tax_paid']
-            if tax_payment > 0:
-                cash_payments[month_idx] += tax_payment
+        cash_payments += np.maximum(pl_arrays['tax_paid'], 0.0)
         
-        # Process planned CAPEX
+        # Process planned CAPEX cash outflows (the assets themselves are
+        # materialized up-front in calculate() so they can depreciate)
         for capex in self.planned_capex:
             if 1 <= capex.purchase_month <= num_months:
                 cf_data['capex'][capex.purchase_month - 1] += capex.purchase_amount
-                
-                # Add to fixed assets after purchase
-                new_asset = capex.to_fixed_asset(self.general.start_date)
-                self.fixed_assets.append(new_asset)
-        
+
         # Process planned disposals
         for disposal in self.planned_disposals:
             if 1 <= disposal.disposal_month <= num_months:
@@ -1244,200 +1740,253 @@ class FarmModel:
                         # TODO: Add to other_income in P&L
                         break
         
-        # Operating cash flow
-        df_cf = pd.DataFrame(cf_data)
-        
-        # Add back non-cash expenses (depreciation and unpaid tax)
-        df_cf['tax_unpaid'] = df_pl['tax_expense'] - df_pl['tax_paid']
-        df_cf['operating_cf'] = (df_cf['net_profit'] + df_cf['depreciation'] + 
-                                  df_cf['tax_unpaid'] - df_cf['working_capital_change'])
-        
+        # Operating cash flow: add back non-cash expenses (depreciation and
+        # unpaid tax)
+        cf_data['tax_unpaid'] = pl_arrays['tax_expense'] - pl_arrays['tax_paid']
+        cf_data['operating_cf'] = (cf_data['net_profit'] + cf_data['depreciation'] +
+                                   cf_data['tax_unpaid'] - working_capital_change)
+
         # Investing cash flow
-        df_cf['investing_cf'] = df_cf['asset_sales'] - df_cf['capex']
-        
+        cf_data['investing_cf'] = cf_data['asset_sales'] - cf_data['capex']
+
         # Financing cash flow
-        df_cf['financing_cf'] = (df_cf['debt_drawdowns'] - df_cf['debt_repayments'] + 
-                                  df_cf['equity_injection'] - df_cf['dividends'])
-        
+        cf_data['financing_cf'] = (cf_data['debt_drawdowns'] - cf_data['debt_repayments'] +
+                                   cf_data['equity_injection'] - cf_data['dividends'])
+
         # Net cash flow
-        df_cf['net_cash_flow'] = df_cf['operating_cf'] + df_cf['investing_cf'] + df_cf['financing_cf']
-        
-        # Cumulative cash
-        df_cf['closing_cash'] = self.opening_balances.cash + df_cf['net_cash_flow'].cumsum()
-        
-        self.monthly_cf = df_cf
+        cf_data['net_cash_flow'] = (cf_data['operating_cf'] + cf_data['investing_cf'] +
+                                    cf_data['financing_cf'])
+
+        # Cumulative cash (compensated sum keeps long-horizon rounding tight)
+        cf_data['closing_cash'] = (self.opening_balances.cash +
+                                   _cumsum_kbn(cf_data['net_cash_flow']))
+
+        # Materialize the frame columnwise in one shot
+        self.monthly_cf = pd.DataFrame(cf_data)
     
     def _calculate_balance_sheet(self, df_pl: pd.DataFrame):
         """Build balance sheet with working capital tracking"""
         num_months = len(df_pl)
-        
-        bs_data = {
-            'month': df_pl['month'].tolist(),
-            'date': df_pl['date'].tolist(),
-            # Assets
-            'cash': [self.opening_balances.cash] * num_months,
-            'trade_debtors': [self.opening_balances.trade_debtors] * num_months,
-            'inventory': [self.opening_balances.inventory_grain + 
-                          self.opening_balances.inventory_wool + 
-                          self.opening_balances.inventory_livestock] * num_months,
-            'fixed_assets': [self.opening_balances.fixed_assets] * num_months,
-            'land_water': [self.opening_balances.land_water] * num_months,
-            # Liabilities
-            'trade_creditors': [self.opening_balances.trade_creditors] * num_months,
-            'debt': [self.opening_balances.debt_facilities] * num_months,
-            'tax_payable': [self.opening_balances.tax_payable] * num_months,
-            # Equity
-            'share_capital': [self.opening_balances.share_capital] * num_months,
-            'retained_earnings': [self.opening_balances.retained_earnings] * num_months,
-        }
-        
-        df_bs = pd.DataFrame(bs_data)
-        
-        # Update cash from cash flow
+        opening = self.opening_balances
+
+        # Cash and working capital from the cash flow
+        cash = np.full(num_months, float(opening.cash))
+        trade_debtors = np.full(num_months, float(opening.trade_debtors))
         if self.monthly_cf is not None:
-            df_bs['cash'] = self.monthly_cf['closing_cash']
-            
-            # Update working capital accounts
-            cumulative_wc_change = self.monthly_cf['working_capital_change'].cumsum()
-            
+            cash = self.monthly_cf['closing_cash'].to_numpy()
+
             # Debtors increase with timing delays on revenue
-            df_bs['trade_debtors'] = self.opening_balances.trade_debtors + cumulative_wc_change
-            
-            # Add GST component to debtors
-            # GST collected but not yet received in cash is part of debtors
+            cumulative_wc_change = np.cumsum(self.monthly_cf['working_capital_change'].to_numpy())
+            trade_debtors = opening.trade_debtors + cumulative_wc_change
+
+            # Add the GST liability to debtors (it's money customers owe us
+            # that we'll pass to ATO)
             if self.monthly_gst is not None:
-                # GST on sales that haven't been received yet
-                cumulative_gst_on_sales = self.monthly_gst['gst_on_sales'].cumsum()
-                cumulative_gst_collected_cash = (self.monthly_gst['gst_on_sales'].shift(1).fillna(0) * 
-                                                (1 if self.payment_timing.crop_sales == 0 else 0)).cumsum()
-                
-                # Simpler approach: cumulative GST owing less cumulative GST paid
-                # This is the GST component sitting in our working capital
-                cumulative_gst_liability = self.monthly_gst['cumulative_gst']
-                
-                # Add the GST liability to debtors (it's money customers owe us that we'll pass to ATO)
-                df_bs['trade_debtors'] = df_bs['trade_debtors'] + cumulative_gst_liability
-            
-            # Creditors stay at opening level (simplified)
-            df_bs['trade_creditors'] = self.opening_balances.trade_creditors
-        
-        # Update tax payable (accrued less paid)
-        df_bs['tax_payable'] = self.opening_balances.tax_payable + df_pl['tax_accrued'] - df_pl['tax_paid'].cumsum()
-        
-        # Update fixed assets with accumulated depreciation and CAPEX
-        cumulative_depreciation = df_pl['depreciation'].cumsum()
-        cumulative_capex = 0
+                trade_debtors = trade_debtors + self.monthly_gst['cumulative_gst'].to_numpy()
+
+        # Monthly CAPEX (dense) for the fixed-asset carrying value
+        capex = np.zeros(num_months)
         if self.monthly_cf is not None:
-            cumulative_capex = self.monthly_cf['capex'].cumsum()
-        
-        df_bs['fixed_assets'] = (self.opening_balances.fixed_assets + 
-                                  cumulative_capex - 
-                                  cumulative_depreciation)
-        
-        # Update debt from facility movements
-        if len(self.debt_facilities) > 0:
-            for month_idx in range(num_months):
-                month = month_idx + 1
-                total_debt = self.opening_balances.debt_facilities
-                for facility in self.debt_facilities:
-                    total_debt += sum(facility.drawdown_schedule.get(m, 0) for m in range(1, month + 1))
-                    total_debt -= sum(facility.repayment_schedule.get(m, 0) for m in range(1, month + 1))
-                df_bs.loc[month_idx, 'debt'] = total_debt
-        
-        # Update GST liability from monthly GST calculations
+            capex = self.monthly_cf['capex'].to_numpy()
+
+        # Net facility draws from the prepared dense schedules; with no
+        # facilities the debt column is just the (constant) opening balance
+        net_draws = np.zeros(num_months)
+        if self.debt_facilities:
+            for facility in self.debt_facilities:
+                draws, repays = facility.as_arrays(num_months)
+                net_draws += draws
+                net_draws -= repays
+
+        # GST balance from monthly GST calculations (constant at the opening
+        # position when GST has not been computed)
         if self.monthly_gst is not None:
-            df_bs['gst_payable'] = self.monthly_gst['cumulative_gst']
+            gst_payable = self.monthly_gst['cumulative_gst'].to_numpy()
         else:
-            df_bs['gst_payable'] = self.opening_balances.gst_liability
-        
-        # Update retained earnings with cumulative profit
-        df_bs['retained_earnings'] = (self.opening_balances.retained_earnings + 
-                                       df_pl['net_profit'].cumsum())
-        
-        # Totals
-        df_bs['total_assets'] = (df_bs['cash'] + df_bs['trade_debtors'] + 
-                                  df_bs['inventory'] + df_bs['fixed_assets'] + 
-                                  df_bs['land_water'])
-        
-        # Add GST receivable to assets (when negative/receivable)
-        df_bs['gst_receivable'] = df_bs['gst_payable'].apply(lambda x: abs(x) if x < 0 else 0)
-        df_bs['total_assets'] = df_bs['total_assets'] + df_bs['gst_receivable']
-        
-        # Only include GST in liabilities when payable (positive)
-        df_bs['gst_liability'] = df_bs['gst_payable'].apply(lambda x: x if x > 0 else 0)
-        
-        df_bs['total_liabilities'] = (df_bs['trade_creditors'] + df_bs['debt'] + 
-                                       df_bs['tax_payable'] + df_bs['gst_liability'])
-        
-        df_bs['total_equity'] = df_bs['share_capital'] + df_bs['retained_earnings']
-        
-        # Check balance
-        df_bs['balance_check'] = df_bs['total_assets'] - (df_bs['total_liabilities'] + df_bs['total_equity'])
-        
-        self.monthly_bs = df_bs
+            gst_payable = np.full(num_months, float(opening.gst_liability))
+
+        # Constant columns
+        inventory = np.full(num_months, float(opening.inventory_grain +
+                                              opening.inventory_wool +
+                                              opening.inventory_livestock))
+        land_water = np.full(num_months, float(opening.land_water))
+        trade_creditors = np.full(num_months, float(opening.trade_creditors))
+        share_capital = np.full(num_months, float(opening.share_capital))
+
+        # One fused rollup from the monthly flows to totals and balance check
+        (tax_payable, fixed_assets, debt, retained_earnings, gst_receivable,
+         gst_liability, total_assets, total_liabilities, total_equity,
+         balance_check) = _bs_rollup(
+            np.asarray(cash, dtype=np.float64), np.asarray(trade_debtors, dtype=np.float64),
+            inventory, land_water, trade_creditors, share_capital,
+            df_pl['tax_accrued'].to_numpy(), df_pl['tax_paid'].to_numpy(),
+            df_pl['depreciation'].to_numpy(), capex,
+            df_pl['net_profit'].to_numpy(), net_draws, gst_payable,
+            float(opening.tax_payable), float(opening.fixed_assets),
+            float(opening.debt_facilities), float(opening.retained_earnings))
+
+        self.monthly_bs = pd.DataFrame({
+            'month': df_pl['month'].tolist(),
+            'date': df_pl['date'].tolist(),
+            # Assets
+            'cash': cash,
+            'trade_debtors': trade_debtors,
+            'inventory': inventory,
+            'fixed_assets': fixed_assets,
+            'land_water': land_water,
+            # Liabilities (creditors stay at opening level - simplified)
+            'trade_creditors': trade_creditors,
+            'debt': debt,
+            'tax_payable': tax_payable,
+            # Equity
+            'share_capital': share_capital,
+            'retained_earnings': retained_earnings,
+            'gst_payable': gst_payable,
+            'gst_receivable': gst_receivable,
+            'gst_liability': gst_liability,
+            'total_assets': total_assets,
+            'total_liabilities': total_liabilities,
+            'total_equity': total_equity,
+            # Check balance
+            'balance_check': balance_check,
+        })
     
     def _summarize_annual(self):
         """Summarize monthly data to annual"""
         if self.monthly_pl is None:
             return
         
-        # Add financial year column
-        self.monthly_pl['fy'] = self.monthly_pl['date'].apply(self.general.get_financial_year)
-        
-        # Group by financial year and sum
-        annual_pl = self.monthly_pl.groupby('fy').agg({
-            'total_income': 'sum',
-            'total_direct_costs': 'sum',
-            'gross_profit': 'sum',
-            'overheads': 'sum',
-            'ebitda': 'sum',
-            'depreciation': 'sum',
-            'ebit': 'sum',
-            'interest_expense': 'sum',
-            'interest_income': 'sum',
-            'ebt': 'sum',
-            'tax_expense': 'sum',
-            'net_profit': 'sum',
-        }).reset_index()
-        
+        # Add financial year column - vectorized dt arithmetic (FY rolls over
+        # after financial_year_end_month), computed once; the monthly
+        # statements share the same date index so the array is reused below
+        dates = pd.to_datetime(self.monthly_pl['date'])
+        fy = dates.dt.year + (dates.dt.month > self.general.financial_year_end_month).astype(int)
+        self.monthly_pl['fy'] = fy
+
+        # Group by financial year and sum. The FY column is sorted, so the
+        # grouped sums reduce to one np.add.reduceat over the stacked metric
+        # columns at the FY-change boundaries - pandas groupby overhead
+        # dominates arithmetic at this size
+        fy_arr = fy.to_numpy()
+        bounds = np.concatenate(([0], np.flatnonzero(np.diff(fy_arr)) + 1))
+
+        pl_cols = ['total_income', 'total_direct_costs', 'gross_profit',
+                   'overheads', 'ebitda', 'depreciation', 'ebit',
+                   'interest_expense', 'interest_income', 'ebt',
+                   'tax_expense', 'net_profit']
+        annual_pl = pd.DataFrame(
+            np.add.reduceat(self.monthly_pl[pl_cols].to_numpy(), bounds, axis=0),
+            columns=pl_cols)
+        annual_pl.insert(0, 'fy', fy_arr[bounds])
+
         self.annual_pl = annual_pl
-        
-        # Annual balance sheet (year-end snapshot)
-        annual_bs = self.monthly_bs.groupby(
-            self.monthly_bs['date'].apply(self.general.get_financial_year)
-        ).last().reset_index(drop=True)
+
+        # The FY boundaries serve all three annual frames; year-end rows are
+        # the last month of each FY
+        year_ends = np.concatenate((bounds[1:] - 1, [len(fy_arr) - 1]))
+
+        # Annual balance sheet (year-end snapshot) - a positional take of the
+        # year-end rows rather than a groupby.last pass
+        annual_bs = self.monthly_bs.iloc[year_ends].reset_index(drop=True)
         annual_bs['fy'] = self.annual_pl['fy']
-        
+
         self.annual_bs = annual_bs
-        
+
         # Annual cash flow
         if self.monthly_cf is not None:
-            self.monthly_cf['fy'] = self.monthly_cf['date'].apply(self.general.get_financial_year)
-            annual_cf = self.monthly_cf.groupby('fy').agg({
-                'operating_cf': 'sum',
-                'investing_cf': 'sum',
-                'financing_cf': 'sum',
-                'net_cash_flow': 'sum',
-            }).reset_index()
-            annual_cf['closing_cash'] = self.monthly_cf.groupby('fy')['closing_cash'].last().values
+            self.monthly_cf['fy'] = fy_arr
+            cf_cols = ['operating_cf', 'investing_cf', 'financing_cf', 'net_cash_flow']
+            annual_cf = pd.DataFrame(
+                np.add.reduceat(self.monthly_cf[cf_cols].to_numpy(), bounds, axis=0),
+                columns=cf_cols)
+            annual_cf.insert(0, 'fy', fy_arr[bounds])
+            annual_cf['closing_cash'] = self.monthly_cf['closing_cash'].to_numpy()[year_ends]
             self.annual_cf = annual_cf
     
     def get_kpis(self) -> Dict:
-        """Calculate and return key KPIs"""
+        """Calculate and return key KPIs
+
+        Reads the final-year values as column scalars (no .iloc row
+        materialization) and memoizes per calculation, since dashboards
+        poll this without recalculating.
+        """
         if self.annual_pl is None or self.annual_bs is None:
             return {}
-        
-        latest_year = self.annual_pl.iloc[-1]
-        latest_bs = self.annual_bs.iloc[-1]
-        
-        return {
-            'ebitda': latest_year['ebitda'],
-            'net_profit': latest_year['net_profit'],
-            'closing_cash': latest_bs['cash'],
-            'total_debt': latest_bs['debt'],
-            'net_assets': latest_bs['total_equity'],
-            'roa': (latest_year['ebit'] / latest_bs['total_assets'] * 100) if latest_bs['total_assets'] > 0 else 0,
+
+        cache_key = (id(self.annual_pl), id(self.annual_bs))
+        cached = getattr(self, '_kpi_cache', None)
+        if cached is not None and cached[0] == cache_key:
+            return cached[1]
+
+        last_pl = {k: self.annual_pl[k].to_numpy()[-1]
+                   for k in ('ebitda', 'net_profit', 'ebit')}
+        last_bs = {k: self.annual_bs[k].to_numpy()[-1]
+                   for k in ('cash', 'debt', 'total_equity', 'total_assets')}
+
+        kpis = {
+            'ebitda': last_pl['ebitda'],
+            'net_profit': last_pl['net_profit'],
+            'closing_cash': last_bs['cash'],
+            'total_debt': last_bs['debt'],
+            'net_assets': last_bs['total_equity'],
+            'roa': (last_pl['ebit'] / last_bs['total_assets'] * 100) if last_bs['total_assets'] > 0 else 0,
         }
+        self._kpi_cache = (cache_key, kpis)
+        return kpis
+
+
+# ============================================================================
+# SCENARIO ANALYSIS
+# ============================================================================
+
+def _run_one_scenario(model_factory, overrides: Dict) -> Dict:
+    """Build a model, apply overrides, calculate, and return compact results
+
+    Overrides are dotted attribute paths on the model (e.g.
+    'general.income_tax_rate'). Results are ndarrays rather than DataFrames
+    to keep inter-process transfer small.
+    """
+    model = model_factory()
+    for path, value in overrides.items():
+        target = model
+        attrs = path.split('.')
+        for attr in attrs[:-1]:
+            target = getattr(target, attr)
+        setattr(target, attrs[-1], value)
+
+    model.calculate()
+    return {
+        'overrides': overrides,
+        'net_profit': model.monthly_pl['net_profit'].to_numpy(),
+        'ebitda': model.monthly_pl['ebitda'].to_numpy(),
+        'closing_cash': model.monthly_cf['closing_cash'].to_numpy(),
+        'kpis': model.get_kpis(),
+    }
+
+
+def run_scenarios(model_factory, param_iter, n_jobs: int = -1) -> List[Dict]:
+    """Run calculate() over a grid of scenario overrides in parallel
+
+    Each calculate() run is independent, so scenario sweeps and Monte-Carlo
+    draws fan out across cores. model_factory must be a picklable callable
+    returning a configured FarmModel; param_iter yields override dicts for
+    _run_one_scenario. n_jobs=-1 uses all cores; n_jobs=1 runs serially.
+    Uses joblib when installed, otherwise the stdlib process pool.
+    """
+    scenarios = list(param_iter)
+    if n_jobs == 1 or len(scenarios) <= 1:
+        return [_run_one_scenario(model_factory, overrides) for overrides in scenarios]
+
+    try:
+        from joblib import Parallel, delayed
+    except ImportError:
+        from concurrent.futures import ProcessPoolExecutor
+        from itertools import repeat
+        max_workers = None if n_jobs == -1 else n_jobs
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(_run_one_scenario, repeat(model_factory), scenarios))
+    return Parallel(n_jobs=n_jobs)(
+        delayed(_run_one_scenario)(model_factory, overrides) for overrides in scenarios)
 
 
 # ============================================================================
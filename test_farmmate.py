@@ -236,17 +236,17 @@ def run_tests():
     print("ENTERPRISE BREAKDOWN (Annual)")
     print("="*80)
     
-    # Crop summary
+    # Crop summary (compute revenue/margin once per crop, reuse for totals)
     print("\nCROPPING:")
-    for crop in model.crop_margins:
-        revenue = crop.calculate_revenue()
-        margin = crop.calculate_margin()
+    crop_results = [(crop, crop.calculate_revenue(), crop.calculate_margin())
+                    for crop in model.crop_margins]
+    for crop, revenue, margin in crop_results:
         print(f"  {crop.crop_name:20} {crop.area_ha:6.0f} ha  "
               f"Revenue: ${revenue:10,.0f}  Margin: ${margin:10,.0f}  "
               f"$/ha: ${margin/crop.area_ha:6.0f}")
-    
-    total_crop_revenue = sum(c.calculate_revenue() for c in model.crop_margins)
-    total_crop_margin = sum(c.calculate_margin() for c in model.crop_margins)
+
+    total_crop_revenue = sum(revenue for _, revenue, _ in crop_results)
+    total_crop_margin = sum(margin for _, _, margin in crop_results)
     print(f"  {'TOTAL CROPPING':20} {sum(c.area_ha for c in model.crop_margins):6.0f} ha  "
           f"Revenue: ${total_crop_revenue:10,.0f}  Margin: ${total_crop_margin:10,.0f}")
     
@@ -302,17 +302,14 @@ def run_tests():
     print("\n" + "="*80)
     print("FIXED ASSETS & DEPRECIATION")
     print("="*80)
-    total_asset_cost = 0
-    total_annual_dep = 0
-    for asset in model.fixed_assets:
-        annual_dep = asset.calculate_annual_depreciation()
-        total_asset_cost += asset.purchase_amount
-        total_annual_dep += annual_dep
-        print(f"  {asset.asset_name:30} ${asset.purchase_amount:10,.0f}  "
-              f"Dep: ${annual_dep:8,.0f}/yr")
-    
-    print(f"  {'TOTAL':30} ${total_asset_cost:10,.0f}  Dep: ${total_annual_dep:8,.0f}/yr")
-    print(f"  Monthly depreciation: ${total_annual_dep/12:,.0f}")
+    asset_arrays = model.fixed_assets_arrays()
+    for name, cost, annual_dep in zip(asset_arrays['name'], asset_arrays['cost'],
+                                      asset_arrays['annual_depreciation']):
+        print(f"  {name:30} ${cost:10,.0f}  Dep: ${annual_dep:8,.0f}/yr")
+
+    print(f"  {'TOTAL':30} ${asset_arrays['cost'].sum():10,.0f}  "
+          f"Dep: ${asset_arrays['annual_depreciation'].sum():8,.0f}/yr")
+    print(f"  Monthly depreciation: ${asset_arrays['monthly_depreciation'].sum():,.0f}")
     
     print("\n" + "="*80)
     print("TEST COMPLETE")